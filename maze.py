@@ -13,6 +13,9 @@ class Dir(IntFlag):
     W = 4
     E = 8
 
+# Plain-int wall bits for the renderers' per-cell loops
+_N, _S, _W, _E = int(Dir.N), int(Dir.S), int(Dir.W), int(Dir.E)
+
 DX = {Dir.E: 1, Dir.W: -1, Dir.N: 0, Dir.S: 0}
 DY = {Dir.E: 0, Dir.W: 0, Dir.N: -1, Dir.S: 1}
 OPPOSITE = {Dir.E: Dir.W, Dir.W: Dir.E, Dir.N: Dir.S, Dir.S: Dir.N}
@@ -169,9 +172,9 @@ def render_ascii(grid: List[List[int]], start=None, end=None) -> str:
         line = ["|"]
         for x in range(w):
             cell = grid[y][x]
-            floor = " " if (cell & int(Dir.S)) else "_"
-            east_wall = " " if (cell & int(Dir.E)) else "|"
-            if (y+1 < h) and not (grid[y+1][x] & int(Dir.N)):
+            floor = " " if (cell & _S) else "_"
+            east_wall = " " if (cell & _E) else "|"
+            if (y+1 < h) and not (grid[y+1][x] & _N):
                 floor = "_"
 
             cell_char = floor
@@ -185,9 +188,29 @@ def render_ascii(grid: List[List[int]], start=None, end=None) -> str:
     return "\n".join(out)
 
 
+def wall_segments(grid: List[List[int]]) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Line segments (cell coordinates) for every wall, for a LineCollection."""
+    h = len(grid)
+    w = len(grid[0]) if h else 0
+    segments = []
+    for y in range(h):
+        for x in range(w):
+            cell = grid[y][x]
+            if not (cell & _N):
+                segments.append(((x, y), (x+1, y)))
+            if not (cell & _W):
+                segments.append(((x, y), (x, y+1)))
+            if y == h-1 and not (cell & _S):
+                segments.append(((x, y+1), (x+1, y+1)))
+            if x == w-1 and not (cell & _E):
+                segments.append(((x+1, y), (x+1, y+1)))
+    return segments
+
+
 def render_matplotlib(grid: List[List[int]], show=True, save_png=None):
     """Draws the maze with matplotlib."""
     import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
     h = len(grid)
     w = len(grid[0]) if h else 0
     fig, ax = plt.subplots()
@@ -198,17 +221,7 @@ def render_matplotlib(grid: List[List[int]], show=True, save_png=None):
     ax.plot([0, 0], [0, h])
     ax.plot([w, w], [0, h])
 
-    for y in range(h):
-        for x in range(w):
-            cell = grid[y][x]
-            if not (cell & int(Dir.N)):
-                ax.plot([x, x+1], [y, y])
-            if not (cell & int(Dir.W)):
-                ax.plot([x, x], [y, y+1])
-            if y == h-1 and not (cell & int(Dir.S)):
-                ax.plot([x, x+1], [y+1, y+1])
-            if x == w-1 and not (cell & int(Dir.E)):
-                ax.plot([x+1, x+1], [y, y+1])
+    ax.add_collection(LineCollection(wall_segments(grid)))
 
     ax.invert_yaxis()
     ax.axis('off')
@@ -2,214 +2,503 @@
 import json
 import heapq
 import argparse
+import multiprocessing
+import time
 import matplotlib.pyplot as plt
-import imageio
-import os
+from matplotlib.collections import LineCollection
+from matplotlib.colors import LinearSegmentedColormap
+from PIL import Image, GifImagePlugin
 import numpy as np
-from typing import List, Tuple, Optional, Dict
-from maze import Dir, DX, DY, render_ascii
+from typing import Tuple
+from maze import Dir, DX, DY, render_ascii, wall_segments, generate_maze_dfs
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; _bfs_kernel then runs as plain Python
+    njit = None
 
-def dijkstra_solve(grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, int]):
-    """Solve maze using Dijkstra (non-visual version)."""
-    h, w = len(grid), len(grid[0])
-    dist: Dict[Tuple[int, int], float] = {start: 0}
-    prev: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
-    pq = [(0, start)]
-    visited = set()
+# Plain-int wall bits, resolved once so loops never go through IntFlag
+_N, _S, _E, _W = int(Dir.N), int(Dir.S), int(Dir.E), int(Dir.W)
+
+# (mask, dx, dy) per direction, so hot loops also skip the DX/DY dict lookups
+DIRS_TABLE = ((_N, DX[Dir.N], DY[Dir.N]), (_S, DX[Dir.S], DY[Dir.S]),
+              (_E, DX[Dir.E], DY[Dir.E]), (_W, DX[Dir.W], DY[Dir.W]))
+
+
+def _path_from_prev(prev_flat: np.ndarray, end_idx: int, w: int):
+    """Follow flat predecessor links back from end_idx to an (x, y) path."""
+    path = []
+    cur = end_idx
+    while cur != -1:
+        y, x = divmod(int(cur), w)
+        path.append((x, y))
+        cur = prev_flat[cur]
+    path.reverse()
+    return path
+
+
+def _bfs_kernel(grid_flat, w, h, start_idx, end_idx, prev_flat, visited, q):
+    """BFS over the flattened grid, filling prev_flat in place.
+
+    All buffers come from the caller: visited is zeroed with one slot per
+    cell and q has h * w slots used with head/tail indices, which is enough
+    since no cell is ever enqueued twice. Written against indexable buffers
+    and ints only so numba can compile it over ndarrays; without numba the
+    caller passes plain lists instead. Returns the number of cells expanded.
+    """
+    head = 0
+    tail = 0
+    visited[start_idx] = 1
+    q[tail] = start_idx
+    tail += 1
+
+    while head < tail:
+        idx = q[head]
+        head += 1
+        if idx == end_idx:
+            break
+        y = idx // w
+        x = idx - y * w
+        cell = grid_flat[idx]
+
+        for mask, dx, dy in DIRS_TABLE:
+            if cell & mask:
+                nx = x + dx
+                ny = y + dy
+                if 0 <= nx < w and 0 <= ny < h:
+                    nidx = ny * w + nx
+                    if not visited[nidx]:
+                        visited[nidx] = 1
+                        prev_flat[nidx] = idx
+                        q[tail] = nidx
+                        tail += 1
+    return head
+
+
+if njit is not None:
+    _bfs_kernel = njit(cache=True)(_bfs_kernel)
+
+
+def dijkstra_solve(grid: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]):
+    """Solve maze using BFS (non-visual version).
+
+    Every passage costs 1, so a plain breadth-first search yields the same
+    shortest path as Dijkstra without any heap operations. The search runs
+    in _bfs_kernel, JIT-compiled when numba is installed.
+    """
+    h, w = grid.shape
+    start_idx = start[1] * w + start[0]
+    end_idx = end[1] * w + end[0]
+
+    # Cells are addressed by flat index y * w + x. numba needs ndarrays;
+    # plain Python reads lists and bytearrays much faster than NumPy scalars.
+    grid_flat = np.ascontiguousarray(grid, dtype=np.uint8).ravel()
+    if njit is not None:
+        prev_flat = np.full(h * w, -1, dtype=np.int32)
+        visited = np.zeros(h * w, dtype=np.uint8)
+        q = np.empty(h * w, dtype=np.int32)
+    else:
+        grid_flat = grid_flat.tolist()
+        prev_flat = [-1] * (h * w)
+        visited = bytearray(h * w)
+        q = [0] * (h * w)
+    _bfs_kernel(grid_flat, w, h, start_idx, end_idx, prev_flat, visited, q)
+    return _path_from_prev(prev_flat, end_idx, w)
+
+
+def astar_solve(grid: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]):
+    """Solve maze using A* with the Manhattan distance heuristic.
+
+    With unit passage costs Manhattan distance is admissible and consistent,
+    so the first time end is popped its path is a shortest one.
+    """
+    h, w = grid.shape
+    ex, ey = end
+    start_idx = start[1] * w + start[0]
+    end_idx = ey * w + ex
+
+    g_score = np.full(h * w, np.iinfo(np.int32).max, dtype=np.int32)
+    prev_flat = np.full(h * w, -1, dtype=np.int32)
+    closed = bytearray(h * w)
+    g_score[start_idx] = 0
+    # Entries are (f, -g, idx): on equal f the deeper cell pops first, which
+    # keeps A* pushing along a corridor instead of widening at shallow depth
+    pq = [(abs(start[0] - ex) + abs(start[1] - ey), 0, start_idx)]
 
     while pq:
-        current_dist, (x, y) = heapq.heappop(pq)
-        if (x, y) == end:
+        _, neg_g, idx = heapq.heappop(pq)
+        g = -neg_g
+        if idx == end_idx:
             break
-        if (x, y) in visited:
+        if closed[idx]:
             continue
-        visited.add((x, y))
+        closed[idx] = 1
+        y, x = divmod(idx, w)
+        cell = int(grid[y, x])
+
+        for mask, dx, dy in DIRS_TABLE:
+            if cell & mask:
+                nx, ny = x + dx, y + dy
+                nidx = ny * w + nx
+                new_g = g + 1
+                if 0 <= nx < w and 0 <= ny < h and new_g < g_score[nidx]:
+                    g_score[nidx] = new_g
+                    prev_flat[nidx] = idx
+                    heapq.heappush(pq, (new_g + abs(nx - ex) + abs(ny - ey), -new_g, nidx))
+
+    return _path_from_prev(prev_flat, end_idx, w)
+
+
+def _expand_level(grid: np.ndarray, frontier, dist: np.ndarray, prev_flat: np.ndarray, other_dist: np.ndarray):
+    """Grow one BFS side by a whole level.
+
+    Returns the next frontier and the best cell (or -1) where this side met
+    the other one, i.e. the meeting cell with the shortest total distance.
+    """
+    h, w = grid.shape
+    next_frontier = []
+    meet, best = -1, h * w
+    for idx in frontier:
+        y, x = divmod(idx, w)
+        cell = int(grid[y, x])
+        d = int(dist[idx]) + 1
+        for mask, dx, dy in DIRS_TABLE:
+            if cell & mask:
+                nx, ny = x + dx, y + dy
+                nidx = ny * w + nx
+                if 0 <= nx < w and 0 <= ny < h and dist[nidx] == -1:
+                    dist[nidx] = d
+                    prev_flat[nidx] = idx
+                    next_frontier.append(nidx)
+                    if other_dist[nidx] != -1 and d + other_dist[nidx] < best:
+                        meet, best = nidx, d + int(other_dist[nidx])
+    return next_frontier, meet
+
+
+def bidirectional_solve(grid: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]):
+    """Solve maze using BFS from both start and end until the two sides meet.
+
+    The smaller frontier is grown one whole level at a time, which keeps the
+    stitched path a shortest one even in mazes with loops.
+    """
+    h, w = grid.shape
+    start_idx = start[1] * w + start[0]
+    end_idx = end[1] * w + end[0]
+    if start_idx == end_idx:
+        return [start]
+
+    dist_fwd = np.full(h * w, -1, dtype=np.int32)
+    dist_bwd = np.full(h * w, -1, dtype=np.int32)
+    prev_fwd = np.full(h * w, -1, dtype=np.int32)
+    prev_bwd = np.full(h * w, -1, dtype=np.int32)
+    dist_fwd[start_idx] = 0
+    dist_bwd[end_idx] = 0
+    q_fwd, q_bwd = [start_idx], [end_idx]
+
+    meet = -1
+    while q_fwd and q_bwd and meet == -1:
+        if len(q_fwd) <= len(q_bwd):
+            q_fwd, meet = _expand_level(grid, q_fwd, dist_fwd, prev_fwd, dist_bwd)
+        else:
+            q_bwd, meet = _expand_level(grid, q_bwd, dist_bwd, prev_bwd, dist_fwd)
+
+    if meet == -1:
+        return [end]
+
+    # Stitch start..meet with the backward links from meet to end
+    path = _path_from_prev(prev_fwd, meet, w)
+    cur = prev_bwd[meet]
+    while cur != -1:
+        y, x = divmod(int(cur), w)
+        path.append((x, y))
+        cur = prev_bwd[cur]
+    return path
 
-        for d in (Dir.N, Dir.S, Dir.E, Dir.W):
-            if grid[y][x] & int(d):
-                nx, ny = x + DX[d], y + DY[d]
-                if 0 <= nx < w and 0 <= ny < h:
-                    new_dist = current_dist + 1
-                    if (nx, ny) not in dist or new_dist < dist[(nx, ny)]:
-                        dist[(nx, ny)] = new_dist
-                        prev[(nx, ny)] = (x, y)
-                        heapq.heappush(pq, (new_dist, (nx, ny)))
 
-    # Reconstruct path
-    path = []
-    cur = end
-    while cur is not None:
-        path.append(cur)
-        cur = prev.get(cur)
+SOLVERS = {"bfs": dijkstra_solve, "astar": astar_solve, "bidir": bidirectional_solve}
+
+
+def _path_from_distances(grid: np.ndarray, distances: np.ndarray, end: Tuple[int, int]):
+    """Walk back from end along strictly decreasing BFS distances."""
+    h, w = grid.shape
+    path = [end]
+    x, y = end
+    while np.isfinite(distances[y, x]) and distances[y, x] > 0:
+        cell = int(grid[y, x])
+        for mask, dx, dy in DIRS_TABLE:
+            if cell & mask:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < w and 0 <= ny < h and distances[ny, nx] == distances[y, x] - 1:
+                    x, y = nx, ny
+                    break
+        path.append((x, y))
     path.reverse()
     return path
 
 
+class _GifStreamWriter:
+    """Animated GIF writer that encodes and writes each frame on append.
+
+    imageio's GIF writers keep every frame until close(); this one holds
+    only the frame being written, so memory does not grow with the frame
+    count. Each frame is quantized on its own and carries a local palette.
+    """
+
+    def __init__(self, file_name: str, duration: float = 0.08):
+        self._fp = open(file_name, "wb")
+        self._info = {"duration": int(duration * 1000)}
+        self._started = False
+
+    def append_data(self, frame: np.ndarray):
+        im = Image.fromarray(frame).quantize(colors=256)
+        if not self._started:
+            header, _ = GifImagePlugin.getheader(im, info=self._info)
+            for chunk in header:
+                self._fp.write(chunk)
+            self._started = True
+        for chunk in GifImagePlugin.getdata(im, include_color_table=True, **self._info):
+            self._fp.write(chunk)
+
+    def close(self):
+        if self._started:
+            self._fp.write(b";")  # GIF trailer
+        self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 def dijkstra_wavefront_gif(
-    grid: List[List[int]],
+    grid: np.ndarray,
     start: Tuple[int, int],
     end: Tuple[int, int],
-    gif_name="maze_wavefront.gif"
+    gif_name="maze_wavefront.gif",
+    frame_stride: int = 1
 ):
-    """Solve a maze using Dijkstra’s algorithm and visualize the wavefront propagation."""
-    h, w = len(grid), len(grid[0])
-    dist: Dict[Tuple[int, int], float] = {start: 0}
-    prev: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
-    pq = [(0, start)]
-    visited = set()
+    """Solve a maze using BFS and visualize the wavefront propagation.
+
+    The wavefront is expanded one BFS level at a time with NumPy boolean
+    masks. A frame is emitted every frame_stride levels (and path cells);
+    the default of 1 keeps every level, since a level is already one ripple.
+    """
+    h, w = grid.shape
+    if frame_stride < 1:
+        raise ValueError("frame_stride must be a positive integer.")
+    open_n = (grid & _N) != 0
+    open_s = (grid & _S) != 0
+    open_w = (grid & _W) != 0
+    open_e = (grid & _E) != 0
+
     all_distances = np.full((h, w), np.inf)
     all_distances[start[1], start[0]] = 0
-
-    frames = []
-    frame_dir = "_frames"
-    os.makedirs(frame_dir, exist_ok=True)
-    step = 0
-
-    def draw_frame(current=None, final_path=None):
-        fig, ax = plt.subplots(figsize=(6, 6))
-        ax.set_aspect('equal')
-        ax.axis('off')
-        ax.set_xlim(0, w)
-        ax.set_ylim(0, h)
-        ax.invert_yaxis()
-
-        # Draw maze walls
-        for y in range(h):
-            for x in range(w):
-                cell = grid[y][x]
-                if not (cell & int(Dir.N)):
-                    ax.plot([x, x + 1], [y, y], color="black", linewidth=1)
-                if not (cell & int(Dir.W)):
-                    ax.plot([x, x], [y, y + 1], color="black", linewidth=1)
-                if y == h - 1 and not (cell & int(Dir.S)):
-                    ax.plot([x, x + 1], [y + 1, y + 1], color="black", linewidth=1)
-                if x == w - 1 and not (cell & int(Dir.E)):
-                    ax.plot([x + 1, x + 1], [y, y + 1], color="black", linewidth=1)
-
+    visited = np.zeros((h, w), dtype=bool)
+    visited[start[1], start[0]] = True
+    frontier = visited.copy()
+
+    # Build the figure and every artist once; frames only swap image data
+    fig, ax = plt.subplots(figsize=(6, 6), dpi=100)
+    fig.subplots_adjust(left=0.02, right=0.98, bottom=0.02, top=0.98)
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    # Draw maze walls; they never change, so one collection serves every frame
+    ax.add_collection(LineCollection(wall_segments(grid.tolist()), colors="black", linewidths=1))
+
+    # Distance gradient: light blue at the start fading to purple, with
+    # unreached (inf) cells left transparent. Rescaling is just set_clim().
+    gradient_cmap = LinearSegmentedColormap.from_list(
+        "wavefront", [(0.6, 0.8, 1.0, 0.6), (0.6, 0.3, 1.0, 0.6)]
+    ).with_extremes(bad=(0.0, 0.0, 0.0, 0.0))
+    gradient_im = ax.imshow(all_distances, cmap=gradient_cmap, vmin=0, vmax=1,
+                            extent=(0, w, h, 0), interpolation="nearest")
+    overlay = np.zeros((h, w, 4))
+    overlay_im = ax.imshow(overlay, extent=(0, w, h, 0), interpolation="nearest")
+
+    # Mark start & end
+    ax.text(start[0] + 0.5, start[1] + 0.5, "S", ha="center", va="center", color="green", fontsize=12, fontweight="bold")
+    ax.text(end[0] + 0.5, end[1] + 0.5, "E", ha="center", va="center", color="red", fontsize=12, fontweight="bold")
+
+    ax.set_xlim(0, w)
+    ax.set_ylim(h, 0)
+
+    def draw_frame(max_d, current=None, final_path=None):
+        """current is a boolean (h, w) mask of the cells on the wavefront."""
         # Draw color gradient
-        max_d = np.nanmax(np.where(np.isfinite(all_distances), all_distances, 0))
-        for y in range(h):
-            for x in range(w):
-                if np.isfinite(all_distances[y, x]) and all_distances[y, x] < np.inf:
-                    color_intensity = all_distances[y, x] / max(1, max_d)
-                    ax.add_patch(
-                        plt.Rectangle((x, y), 1, 1, color=(0.6, 0.8 - 0.5 * color_intensity, 1.0), alpha=0.6)
-                    )
-
-        # Current node
-        if current:
-            ax.add_patch(plt.Rectangle((current[0], current[1]), 1, 1, color="orange", alpha=0.9))
-
-        # Final path
+        gradient_im.set_data(all_distances)
+        gradient_im.set_clim(0, max(1, max_d))
+
+        # Current wavefront and final path share one overlay image
+        overlay.fill(0)
+        if current is not None:
+            overlay[current] = (1.0, 0.647, 0.0, 0.9)
         if final_path:
-            for (px, py) in final_path:
-                ax.add_patch(plt.Rectangle((px, py), 1, 1, color="lime", alpha=0.8))
+            px, py = zip(*final_path)
+            overlay[list(py), list(px)] = (0.0, 1.0, 0.0, 0.8)
+        overlay_im.set_data(overlay)
 
-        # Mark start & end
-        ax.text(start[0] + 0.5, start[1] + 0.5, "S", ha="center", va="center", color="green", fontsize=12, fontweight="bold")
-        ax.text(end[0] + 0.5, end[1] + 0.5, "E", ha="center", va="center", color="red", fontsize=12, fontweight="bold")
+        # Grab the rendered pixels straight from the canvas
+        fig.canvas.draw()
+        return np.asarray(fig.canvas.buffer_rgba())[..., :3].copy()
 
-        frame_path = os.path.join(frame_dir, f"frame_{step:04d}.png")
-        plt.savefig(frame_path, dpi=100, bbox_inches="tight")
+    # Frames are encoded and written to the GIF as they are drawn, so only
+    # the current frame is ever held in memory. The writer and figure are
+    # released even if drawing fails part-way.
+    try:
+        with _GifStreamWriter(gif_name, duration=0.08) as writer:
+            level = 0
+            max_d = 0
+            while frontier.any():
+                # The frontier holds the farthest cells reached so far
+                max_d = level
+                reached = visited[end[1], end[0]]
+                if level % frame_stride == 0 or reached:
+                    writer.append_data(draw_frame(max_d, current=frontier))
+
+                if reached:
+                    break
+
+                # Step every frontier cell through each open passage at once
+                new = np.zeros_like(frontier)
+                new[:-1, :] |= frontier[1:, :] & open_n[1:, :]
+                new[1:, :] |= frontier[:-1, :] & open_s[:-1, :]
+                new[:, :-1] |= frontier[:, 1:] & open_w[:, 1:]
+                new[:, 1:] |= frontier[:, :-1] & open_e[:, :-1]
+                new &= ~visited
+
+                level += 1
+                all_distances[new] = level
+                visited |= new
+                frontier = new
+
+            path = _path_from_distances(grid, all_distances, end)
+
+            # Draw final few frames
+            for i in range(len(path)):
+                if i % frame_stride == 0 or i == len(path) - 1:
+                    writer.append_data(draw_frame(max_d, final_path=path[:i + 1]))
+    finally:
         plt.close(fig)
-        return frame_path
-
-    global_step = 0
-    while pq:
-        current_dist, (x, y) = heapq.heappop(pq)
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
-        all_distances[y, x] = current_dist
-        global_step += 1
-        step = global_step
-        frames.append(imageio.imread(draw_frame(current=(x, y))))
-
-        if (x, y) == end:
-            break
-
-        for d in (Dir.N, Dir.S, Dir.E, Dir.W):
-            if grid[y][x] & int(d):
-                nx, ny = x + DX[d], y + DY[d]
-                if 0 <= nx < w and 0 <= ny < h:
-                    new_dist = current_dist + 1
-                    if new_dist < all_distances[ny, nx]:
-                        all_distances[ny, nx] = new_dist
-                        prev[(nx, ny)] = (x, y)
-                        heapq.heappush(pq, (new_dist, (nx, ny)))
-
-    # Reconstruct path
-    path = []
-    cur = end
-    while cur is not None:
-        path.append(cur)
-        cur = prev.get(cur)
-    path.reverse()
-
-    # Draw final few frames
-    for i in range(len(path)):
-        step = global_step + i
-        frames.append(imageio.imread(draw_frame(final_path=path[:i + 1])))
-
-    imageio.mimsave(gif_name, frames, duration=0.08)
     print(f"Wavefront GIF saved as {gif_name}")
 
-    for f in os.listdir(frame_dir):
-        os.remove(os.path.join(frame_dir, f))
-    os.rmdir(frame_dir)
-
     return path
 
 
 def save_text_maze(grid, path, file_name="maze_solved.txt"):
     """Generate and save a solved maze in ASCII format."""
-    lines = render_ascii(grid, start=path[0], end=path[-1]).splitlines()
-    for (x, y) in path[1:-1]:
-        line = list(lines[y + 1])
+    # render_ascii indexes grid[y][x]; nested lists make that cheap
+    lines = render_ascii(np.asarray(grid).tolist(), start=path[0], end=path[-1]).splitlines()
+
+    # Mark path cells in place, one mutable buffer per rendered row
+    row_buffers = [bytearray(line, "utf-8") for line in lines]
+    for i in range(1, len(path) - 1):
+        x, y = path[i]
+        buf = row_buffers[y + 1]
         pos = 1 + 2 * x
-        if pos < len(line) and line[pos] in (" ", "_"):
-            line[pos] = "."
-        lines[y + 1] = "".join(line)
-    solved_text = "\n".join(lines)
+        if pos < len(buf) and buf[pos] in (0x20, 0x5F):  # " " or "_"
+            buf[pos] = 0x2E  # "."
+    solved_text = "\n".join(buf.decode("utf-8") for buf in row_buffers)
     with open(file_name, "w", encoding="utf-8") as f:
         f.write(solved_text)
     print(f"Solved maze saved as {file_name}")
 
 
+def _warm_worker():
+    """Pool initializer: load or compile the BFS kernel before any timed solve."""
+    dijkstra_solve(np.zeros((1, 1), dtype=np.uint8), (0, 0), (0, 0))
+
+
+def _solve_one(job):
+    """Generate and solve one maze for --batch (top level so Pool can pickle it)."""
+    seed, width, height, solver, gif, txt, frame_stride = job
+    grid = np.asarray(generate_maze_dfs(width, height, seed=seed), dtype=np.uint8)
+    start = (0, 0)
+    end = (width - 1, height - 1)
+
+    t0 = time.perf_counter()
+    if gif:
+        path = dijkstra_wavefront_gif(grid, start, end, gif_name=f"maze_wavefront_{seed}.gif", frame_stride=frame_stride)
+    else:
+        path = SOLVERS[solver](grid, start, end)
+    elapsed = time.perf_counter() - t0
+
+    if txt:
+        save_text_maze(grid, path, file_name=f"maze_solved_{seed}.txt")
+    return seed, len(path), elapsed
+
+
+def run_batch(args):
+    """Generate and solve args.batch mazes (seeds 0..N-1) across a process pool."""
+    jobs = [
+        (seed, args.width, args.height, args.solver, args.gif, args.txt, args.frame_stride)
+        for seed in range(args.batch)
+    ]
+    workers = args.workers or multiprocessing.cpu_count()
+
+    t0 = time.perf_counter()
+    with multiprocessing.Pool(workers, initializer=_warm_worker) as pool:
+        results = pool.map(_solve_one, jobs)
+    wall = time.perf_counter() - t0
+
+    lengths = [length for _, length, _ in results]
+    solve_times = [elapsed for _, _, elapsed in results]
+    print(f"Solved {len(results)} {args.width}x{args.height} mazes with {workers} workers in {wall:.2f}s")
+    print(f"Path length: min {min(lengths)}, mean {sum(lengths) / len(lengths):.1f}, max {max(lengths)}")
+    print(f"Solve time per maze: mean {1000 * sum(solve_times) / len(solve_times):.2f} ms")
+
+
 def main():
-    parser = argparse.ArgumentParser(description="Solve maze using Dijkstra’s algorithm.")
+    parser = argparse.ArgumentParser(description="Solve maze using breadth-first search.")
     parser.add_argument("--gif", action="store_true", help="Generate GIF visualization only.")
     parser.add_argument("--txt", action="store_true", help="Generate text solution only.")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="bfs", help="Solver for the text solution (the GIF always shows the BFS wavefront).")
+    parser.add_argument("--frame-stride", type=int, default=1, help="Emit one GIF frame every N BFS levels (default: every level).")
+    parser.add_argument("--batch", type=int, default=None, help="Generate and solve N DFS mazes in parallel instead of maze_grid.json.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for --batch (default: CPU count).")
+    parser.add_argument("--width", type=int, default=20, help="Maze width for --batch (cells)")
+    parser.add_argument("--height", type=int, default=12, help="Maze height for --batch (cells)")
     args = parser.parse_args()
+    if args.frame_stride < 1:
+        parser.error("--frame-stride must be at least 1")
+
+    if args.batch is not None:
+        if args.batch < 1:
+            parser.error("--batch must be at least 1")
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be at least 1")
+        if args.width < 1 or args.height < 1:
+            parser.error("--width and --height must be at least 1")
+        run_batch(args)
+        return
 
     # Load maze
     try:
         with open("maze_grid.json", "r", encoding="utf-8") as f:
-            grid = json.load(f)
+            grid = np.asarray(json.load(f), dtype=np.uint8)
         print("Maze grid loaded from maze_grid.json")
     except FileNotFoundError:
         print("maze_grid.json not found. Run maze.py first.")
         return
 
-    height = len(grid)
-    width = len(grid[0])
+    height, width = grid.shape
     start = (0, 0)
     end = (width - 1, height - 1)
 
     # Behavior depends on flags
     if args.gif and args.txt:
         print("Generating both GIF and TXT outputs...")
-        path = dijkstra_wavefront_gif(grid, start, end)
+        path = dijkstra_wavefront_gif(grid, start, end, frame_stride=args.frame_stride)
         save_text_maze(grid, path)
 
     elif args.gif:
         print("Generating GIF output only...")
-        path = dijkstra_wavefront_gif(grid, start, end)
+        path = dijkstra_wavefront_gif(grid, start, end, frame_stride=args.frame_stride)
 
     elif args.txt:
         print("Generating TXT output only...")
-        path = dijkstra_solve(grid, start, end)
+        path = SOLVERS[args.solver](grid, start, end)
         save_text_maze(grid, path)
 
     else: